@@ -7,6 +7,7 @@ from typing import Generator
 
 # SyferText relative
 from .token import Token
+from .token_meta import TokenMeta
 from .utils import normalize_slice
 
 
@@ -33,7 +34,7 @@ class Span:
         self.end = end
 
         # A dictionary to hold custom attributes
-        self.attributes = token_meta.attributes
+        self.attributes: Dict[str, List[str]] = dict()
 
     def __getitem__(self, key: Union[int, slice]):
         """Returns a Token object at position `key` or returns Span using slice `key` or the
@@ -48,10 +49,18 @@ class Span:
 
         if isinstance(key, int):
 
+            # The index of the token within the parent document
             if key < 0:
-                token_meta = self.doc.token_metas[self.end + key]
+                idx = self.end + key
             else:
-                token_meta = self.doc.token_metas[self.start + key]
+                idx = self.start + key
+
+            # Check the index the same way a list would
+            if not self.start <= idx < self.end:
+                raise IndexError("Span index out of range")
+
+            # Create the TokenMeta object giving access to the token's meta data
+            token_meta = TokenMeta(self.doc, idx)
 
             # Create a Token object
             token = Token(doc=self.doc, token_meta=token_meta, position=key)
@@ -84,6 +93,14 @@ class Span:
             # Yield a Token object
             yield self[i]
 
+    @property
+    def texts(self) -> List[str]:
+        """Returns a new list holding the text of each token of the Span, in order,
+        without creating Token objects.
+        """
+
+        return self.doc.token_texts[self.start : self.end]
+
     def as_doc(self):
         """Create a `Doc` object with a copy of the `Span`'s tokens.
 
@@ -94,10 +111,16 @@ class Span:
         # Create a new doc object
         doc = self.doc.__class__()
 
-        # Iterate over the token_meta present in span
-        for idx in range(self.start, self.end):
-
-            # Add token meta object to the new doc
-            doc.token_metas.append(self.doc.token_metas[idx])
+        # Copy the meta data columns of the tokens present in the span
+        doc.token_texts = self.doc.token_texts[self.start : self.end]
+        doc.token_spaces = self.doc.token_spaces[self.start : self.end]
+
+        # Copy the custom attributes of these tokens, shifting their
+        # indices to the start of the new doc
+        doc.token_attributes = {
+            idx - self.start: dict(attributes)
+            for idx, attributes in self.doc.token_attributes.items()
+            if self.start <= idx < self.end
+        }
 
         return doc
@@ -1,8 +1,10 @@
 from .token import Token
+from .token_meta import TokenMeta
 
 from typing import List
 from typing import Dict
 from typing import Set
+from typing import Tuple
 from typing import Union
 from typing import Generator
 from .span import Span
@@ -12,9 +14,22 @@ from .utils import normalize_slice
 class TextDoc:
     def __init__(self):
 
-        # This list is populated in the __call__ method of the Tokenizer object.
-        # Its members are objects of the TokenMeta class
-        self.token_metas = list()
+        # The meta data of the tokens are stored column-wise, each list holding
+        # one field of every token. These lists are populated in the __call__
+        # method of the Tokenizer object.
+
+        # The text of each token
+        self.token_texts: List[str] = list()
+
+        # Whether each token is followed by a single white space (1) or not (0).
+        # A bytearray stores each flag in a single byte instead of a reference
+        # to a Python object.
+        self.token_spaces = bytearray()
+
+        # The dictionaries of custom attributes of the tokens, keyed by the
+        # index of the token. Only the tokens that were given custom attributes
+        # have an entry.
+        self.token_attributes: Dict[int, Dict[str, List[str]]] = dict()
 
         # A dictionary to hold custom attributes
         self.attributes: Dict[str, List[str]] = dict()
@@ -38,8 +53,12 @@ class TextDoc:
             else:
                 idx = key
 
-            # Get the corresponding TokenMeta object
-            token_meta = self.token_metas[idx]
+            # Check the index the same way a list would
+            if not 0 <= idx < len(self):
+                raise IndexError("TextDoc index out of range")
+
+            # Create the TokenMeta object giving access to the token's meta data
+            token_meta = TokenMeta(self, idx)
 
             # Create a Token object
             token = Token(doc=self, token_meta=token_meta, position=key)
@@ -58,15 +77,42 @@ class TextDoc:
 
     def __len__(self):
         """Return the number of tokens in the Doc."""
-        return len(self.token_metas)
+        return len(self.token_texts)
 
     def __iter__(self):
-        """Allows to loop over tokens in `self.token_metas`"""
-        for i in range(len(self.token_metas)):
+        """Allows to loop over the tokens of the Doc"""
+        for i in range(len(self.token_texts)):
 
             # Yield a Token object
             yield self[i]
 
+    @property
+    def texts(self) -> List[str]:
+        """Returns a new list holding the text of each token of the Doc, in order,
+        without creating Token objects.
+        """
+        return list(self.token_texts)
+
+    @property
+    def token_metas(self) -> Tuple[TokenMeta, ...]:
+        """The TokenMeta objects of the tokens of the Doc, in order. They are views on
+        the meta data stored by the Doc. Use `append_token` to add a token to the Doc.
+        """
+
+        return tuple(TokenMeta(self, idx) for idx in range(len(self.token_texts)))
+
+    def append_token(self, text: str, space_after: bool):
+        """Appends a token at the end of the Doc.
+
+        Args:
+            text (str): The token's text.
+            space_after (bool): Whether the token is followed by a single white
+                space (True) or not (False).
+        """
+
+        self.token_texts.append(text)
+        self.token_spaces.append(bool(space_after))
+
     @property
     def text(self):
         """Returns the text present in the doc with whitespaces"""
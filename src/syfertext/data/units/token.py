@@ -1,4 +1,9 @@
 class Token:
+
+    # A Token object is created each time a token of a document is
+    # accessed, so avoid allocating a `__dict__` for each of them.
+    __slots__ = ("doc", "token_meta", "position")
+
     def __init__(self, doc: "TextDoc", token_meta: "TokenMeta", position: int):
 
         self.doc = doc
@@ -8,14 +13,16 @@ class Token:
 
         self.position = position
 
-        # A dictionary to hold custom attributes
-        self.attributes = token_meta.attributes
-
     def __str__(self):
         # The call to `str()` in the following is to account for the case
         # when text is of type String or StringPointer (which are Syft string types)
         return self.text
 
+    @property
+    def attributes(self):
+        """A dictionary to hold custom attributes"""
+        return self.token_meta.attributes
+
     @property
     def text(self):
         """Get the token text in str type"""
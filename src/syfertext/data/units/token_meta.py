@@ -1,20 +1,113 @@
+from typing import Dict
+from typing import List
+
+
 class TokenMeta:
-    """This class holds some meta data about a token from the text held by a Doc object.
+    """This class gives access to the meta data about a token from the text held by a Doc object.
     This allows to create a Token object when needed.
+
+    The meta data themselves are stored column-wise by the Doc object, one list per
+    field, so a TokenMeta object is only a lightweight view on the `index`-th entry
+    of each column. It is created on demand, when the token is accessed.
     """
 
-    def __init__(self, text: str, space_after: bool):
+    __slots__ = ("doc", "index")
+
+    def __init__(self, doc: "TextDoc", index: int):
         """Initializes a TokenMeta object
 
         Args:
-            text (str): The token's text.
-            space_after (bool): Whether the token is followed by a single white
-                space (True) or not (False).
+            doc (TextDoc): The document holding the token's meta data.
+            index (int): The non-negative index of the token within `doc`.
+        """
+
+        self.doc = doc
+
+        self.index = index
+
+    @property
+    def text(self) -> str:
+        """The token's text."""
+
+        return self.doc.token_texts[self.index]
+
+    @text.setter
+    def text(self, text: str):
+
+        self.doc.token_texts[self.index] = text
+
+    @property
+    def space_after(self) -> bool:
+        """Whether the token is followed by a single white space (True) or not (False)."""
+
+        return bool(self.doc.token_spaces[self.index])
+
+    @space_after.setter
+    def space_after(self, space_after: bool):
+
+        self.doc.token_spaces[self.index] = space_after
+
+    @property
+    def attributes(self) -> Dict[str, List[str]]:
+        """A dictionary to hold custom attributes"""
+
+        attributes = self.doc.token_attributes.get(self.index)
+
+        # The dictionaries of custom attributes are only stored once an attribute
+        # is set, since most tokens never get any. Reading them stores nothing.
+        if attributes is None:
+            attributes = _PendingAttributes(self.doc, self.index)
+
+        return attributes
+
+
+class _PendingAttributes(dict):
+    """An empty dictionary of custom attributes of a token that has none yet. It
+    is only stored by the Doc object when an attribute is first set through it.
+    """
+
+    __slots__ = ("doc", "index")
+
+    def __init__(self, doc: "TextDoc", index: int):
+        """Initializes a _PendingAttributes object
+
+        Args:
+            doc (TextDoc): The document holding the token's custom attributes.
+            index (int): The non-negative index of the token within `doc`.
+        """
+
+        super().__init__()
+
+        self.doc = doc
+
+        self.index = index
+
+    def _store(self) -> Dict[str, List[str]]:
+        """Stores this dictionary as the token's one, unless another one was stored
+        in the meantime, and returns the stored dictionary.
         """
 
-        self.text = text
+        return self.doc.token_attributes.setdefault(self.index, self)
+
+    def __setitem__(self, name: str, value: List[str]):
+
+        dict.__setitem__(self._store(), name, value)
+
+    def setdefault(self, name: str, default: List[str] = None) -> List[str]:
+
+        return dict.setdefault(self._store(), name, default)
+
+    def update(self, *args, **kwargs):
+
+        dict.update(self._store(), *args, **kwargs)
+
+    def __ior__(self, other: Dict[str, List[str]]) -> Dict[str, List[str]]:
+
+        self.update(other)
+
+        return self
 
-        self.space_after = space_after
+    def __reduce__(self):
 
-        # A dictionary to hold custom attributes
-        self.attributes: Dict[str, List[str]] = dict()
+        # Pickled and copied as a plain dictionary
+        return dict, (dict(self),)
@@ -12,6 +12,11 @@ def normalize_slice(length: int, start: int, stop: int, step: int = None):
             normalized values of the slice
     """
 
+    # Most slices, e.g. doc[2:5], are already within bounds, in which
+    # case there is nothing to normalize
+    if step is None and start is not None and stop is not None and 0 <= start <= stop <= length:
+        return start, stop
+
     assert step is None or step == 1, "Stepped slices with steps greater than one are not supported"
 
     # if start is none, that means we need to start from 0 index
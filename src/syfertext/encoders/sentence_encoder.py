@@ -24,16 +24,14 @@ class SentenceEncoder:
         """Encode the given text.
         """
 
-        # Intialize the list that will hold the token IDs
-        token_ids = []
-
         # Tokenize
         text_doc = self.tokenizer(text)
 
         # Convert words to integer ids using
-        # the vocabulary
-        for token in text_doc:
-            token_ids.append(self.vocab.get_id(token.text))
+        # the vocabulary. The token texts are read all at
+        # once, without creating Token objects. Any doc-like
+        # object, e.g. a Span, gives them through `texts`.
+        token_ids = self.vocab.get_ids(text_doc.texts)
 
         # Prepare the encoder output
         enc_output = dict(doc=text_doc, token_ids=token_ids)
@@ -1,3 +1,10 @@
+from typing import List
+
+# Maps the ASCII white spaces other than the space character (tab, line feed,
+# vertical tab, form feed and carriage return) to a space
+_WHITE_SPACES_TO_SPACE = str.maketrans("\t\n\x0b\x0c\r", "     ")
+
+
 class DefaultTokenizer:
     def __init__(self, prefixes, suffixes, infixes, exceptions):
 
@@ -6,6 +13,19 @@ class DefaultTokenizer:
         self.infixes = infixes
         self.exceptions = exceptions
 
-    def __call__(self, text: str):
+    def __call__(self, text: str) -> List[str]:
+        """Splits `text` on each single ASCII white space, i.e. a space, a tab,
+        a line feed, a vertical tab, a form feed or a carriage return.
+        Consecutive white spaces give empty tokens, as with `text.split(" ")`
+        for spaces.
+
+        Args:
+            text: The text to be tokenized.
+
+        Returns:
+            The list of the tokens of `text`, in order.
+        """
 
-        return text.split(" ")
+        # Turn all ASCII white spaces into spaces in a single pass, then split
+        # the text in C rather than looking for the spaces in a Python loop
+        return text.translate(_WHITE_SPACES_TO_SPACE).split(" ")
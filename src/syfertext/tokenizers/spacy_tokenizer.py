@@ -1,13 +1,20 @@
 # stdlib
+import os
 import re
+import threading
 
-from collections import defaultdict
+from collections import OrderedDict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Union
 from typing import Tuple
 from typing import Match
-from typing import DefaultDict
 from typing import Dict
 from typing import Set
 
@@ -16,7 +23,8 @@ from syft.lib.python.string import String as SyString
 
 # syfertext relative
 from ..data.units import TextDoc
-from ..data.units import TokenMeta
+from ..data.units import Token
+from .token_exception import ORTH
 from .token_exception import TOKENIZER_EXCEPTIONS
 from .punctuations import TOKENIZER_PREFIXES
 from .punctuations import TOKENIZER_SUFFIXES
@@ -24,6 +32,42 @@ from .punctuations import TOKENIZER_INFIXES
 from .utils import compile_suffix_regex
 from .utils import compile_infix_regex
 from .utils import compile_prefix_regex
+from .utils import compile_cached_regex
+
+# Matches maximal runs of characters that are not white spaces
+_NON_SPACE_RUN = re.compile(r"\S+")
+
+# A snapshot of the default affix rules. None of them can match a word made
+# of letters only, so with these rules such a word is always a single token,
+# unless it is an exception case.
+_DEFAULT_AFFIXES = (tuple(TOKENIZER_PREFIXES), tuple(TOKENIZER_SUFFIXES), tuple(TOKENIZER_INFIXES))
+
+# Token texts shorter than this number of characters are shared, so that the
+# many occurrences of frequent tokens use a single string object. Longer ones
+# are rare and sharing them would only fill the table of shared texts.
+_MAX_SHARED_SIZE = 32
+
+# The maximum number of texts in the table of shared texts of a tokenizer.
+# Frequent tokens show up early, so texts are no longer added once it is full.
+_MAX_SHARED_TEXTS = 50000
+
+# Texts longer than this number of characters are not kept in the cache of
+# tokenized texts, so that a few very long texts do not fill up the memory.
+_MAX_CACHED_TEXT_SIZE = 10000
+
+
+class AffixBuckets:
+    """Holds the lists of token texts of each affix type (prefix, suffix, infix)
+    found while splitting a substring.
+    """
+
+    __slots__ = ("prefix", "suffix", "infix")
+
+    def __init__(self):
+
+        self.prefix = []
+        self.suffix = []
+        self.infix = []
 
 
 class SpacyTokenizer:
@@ -36,6 +80,7 @@ class SpacyTokenizer:
         prefixes: List[str] = None,
         suffixes: List[str] = None,
         infixes: List[str] = None,
+        cache_size: int = 0,
     ):
         """Initializes the `Tokenizer` object. Pass in empty lists for suffix, prefix and infix
         if you don't want any suffix, prefix and infix rules and empty dict for no exception rules.
@@ -60,10 +105,16 @@ class SpacyTokenizer:
                 tokenization.
                 Example: ["-"]. So in  "Hell-o", "-" will be separated as
                 an infix.
+            cache_size: The number of tokenized texts to keep, so that tokenizing
+                one of them again only copies its tokens. Texts longer than 10,000
+                characters are never kept. Defaults to 0, i.e. no cache, since a
+                text that is not in the cache costs a bit more to tokenize.
         """
 
         super(SpacyTokenizer, self).__init__()
 
+        self.cache_size = cache_size
+
         # Set the tokenization rules
         self.load_rules(
             exceptions=exceptions, prefixes=prefixes, suffixes=suffixes, infixes=infixes
@@ -104,7 +155,9 @@ class SpacyTokenizer:
         Modifies:
             properties `exceptions`, `prefix_search`, `suffix_search`,
                `infix_finditer`, `prefixes`, `suffixes`, and `infixes`
-               are created by this method.
+               are created by this method. The texts of the exception
+               tokens are extracted and the caches of substring
+               decompositions and of tokenized texts are reset.
 
 
         """
@@ -126,15 +179,83 @@ class SpacyTokenizer:
         else:
             self.infixes = TOKENIZER_INFIXES
 
-        self.prefix_search = compile_prefix_regex(self.prefixes).search if self.prefixes else None
-        self.suffix_search = compile_suffix_regex(self.suffixes).search if self.suffixes else None
-        self.infix_finditer = compile_infix_regex(self.infixes).finditer if self.infixes else None
+        # The compiled regex objects are shared between tokenizers that use the same rules
+        self.prefix_search = (
+            compile_cached_regex(compile_prefix_regex, self.prefixes).search
+            if self.prefixes
+            else None
+        )
+        self.suffix_search = (
+            compile_cached_regex(compile_suffix_regex, self.suffixes).search
+            if self.suffixes
+            else None
+        )
+        self.infix_finditer = (
+            compile_cached_regex(compile_infix_regex, self.infixes).finditer
+            if self.infixes
+            else None
+        )
 
         if exceptions is not None:
             self.exceptions = exceptions
         else:
             self.exceptions = TOKENIZER_EXCEPTIONS
 
+        # The texts of the tokens each exception case is split into. They only
+        # depend on the rules, so extract them once here. A token is described
+        # either by its text or by a dict holding its text under the "ORTH" key.
+        self._exception_orths = {
+            exception: tuple(token if isinstance(token, str) else token[ORTH] for token in tokens)
+            for exception, tokens in self.exceptions.items()
+        }
+
+        # Whether words made of letters only can skip the affix splitting, which
+        # is only known to be true for the default affix rules
+        affixes = (tuple(self.prefixes), tuple(self.suffixes), tuple(self.infixes))
+        self._letters_only_is_token = affixes == _DEFAULT_AFFIXES
+
+        # The way a substring is split into tokens only depends on the substring
+        # and on the rules above. So cache it, and start with an empty cache
+        # every time the rules are set.
+        self._cached_decompose = lru_cache(maxsize=4096)(self._decompose)
+
+        # The same goes for whole texts, when they are often tokenized again,
+        # e.g. when they are sent several times. Each text is mapped to the
+        # columns of its document, the most recently used texts last.
+        self._doc_cache: "OrderedDict[str, Tuple[Tuple[str, ...], bytes]]" = OrderedDict()
+
+        # Reordering and evicting the entries of the cache are not atomic, so the
+        # threads sharing the tokenizer take turns to update it
+        self._doc_cache_lock = threading.Lock()
+
+        # The string object shared by the occurrences of each short token text
+        # seen so far. Unlike `sys.intern`, whose strings are kept as long as the
+        # process runs, the table is bounded and goes with the tokenizer.
+        self._shared_texts: Dict[str, str] = dict()
+
+    def __getstate__(self) -> Tuple:
+        """Returns the state of the tokenizer to be pickled.
+
+        The state is made of the tokenization rules and the cache size, packed in a
+        single tuple. The compiled regexes and the caches are rebuilt from them when
+        unpickling.
+        """
+
+        return self.exceptions, self.prefixes, self.suffixes, self.infixes, self.cache_size
+
+    def __setstate__(self, state: Tuple):
+        """Restores the tokenizer from the state returned by `__getstate__`.
+
+        Args:
+            state: The tokenization rules of the pickled tokenizer.
+        """
+
+        exceptions, prefixes, suffixes, infixes, self.cache_size = state
+
+        self.load_rules(
+            exceptions=exceptions, prefixes=prefixes, suffixes=suffixes, infixes=infixes
+        )
+
     def __call__(self, text: Union[SyString, str]):
         """The real tokenization procedure takes place here.
         As in the spaCy library. This is not exactly equivalent to
@@ -159,124 +280,364 @@ class SpacyTokenizer:
 
         """
 
+        # Convert Syft strings to native `str` once, so that all slicing
+        # below is done on a plain string.
+        text = str(text)
+
+        if self.cache_size <= 0 or len(text) > _MAX_CACHED_TEXT_SIZE:
+            return self._make_doc(text)
+
+        cache = self._doc_cache
+
+        # Repeated texts are served from the cache. The cached columns are never
+        # handed out, since documents can be modified, e.g. by setting custom
+        # attributes. Return a new document with copies of them instead.
+        with self._doc_cache_lock:
+
+            columns = cache.get(text)
+
+            if columns is not None:
+                cache.move_to_end(text)
+
+        if columns is not None:
+
+            doc = TextDoc()
+            doc.token_texts = list(columns[0])
+            doc.token_spaces = bytearray(columns[1])
+
+            return doc
+
+        # The text is tokenized outside of the lock, so that the other threads
+        # can use the cache meanwhile
+        doc = self._make_doc(text)
+
+        # Keep an immutable copy of the columns, dropping the least recently
+        # used text if the cache is full
+        with self._doc_cache_lock:
+
+            cache[text] = (tuple(doc.token_texts), bytes(doc.token_spaces))
+
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+
+        return doc
+
+    def _make_doc(self, text: str) -> TextDoc:
+        """Tokenize `text` into a new document, without using the cache of
+        tokenized texts.
+
+        Args:
+            text: The text to be tokenized.
+
+        Returns:
+            doc: The document holding the meta data of the tokens of `text`.
+        """
+
         # Create a document that will hold meta data of tokens
         # By meta data I mean the token's text and whether the token
         # is followed by a white space or not.
         doc = TextDoc()
 
+        # The columns of the document holding the meta data of the tokens
+        texts = doc.token_texts
+        spaces = doc.token_spaces
+
         # The number of characters in the text
         text_size = len(text)
 
-        # Return empty doc for empty strings ("")
-        if text_size == 0:
-            return doc
-
         # Initialize a pointer to the position of the first character of 'text'
+        # that is not yet part of any token
         pos = 0
 
-        # This is a flag to indicate whether the character we are comparing
-        # to is a white space or not
-        is_space = text[0].isspace()
+        # Bind the method used in the loop to a local name
+        tokenize = self._tokenize
+
+        # Each match is a maximal run of characters that are not white spaces.
+        # The regex engine classifies characters exactly as `str.isspace()` does,
+        # but the scan over the characters runs in C instead of a Python loop.
+        for match in _NON_SPACE_RUN.finditer(text):
+
+            start, end = match.span()
+
+            # The white spaces found between the previous token and the current one
+            # make up a token of their own, except for the single white space that
+            # is recorded in the `space_after` attribute of the previous token.
+            if start > pos:
 
-        # Start tokenization
-        for i, char in enumerate(text):
+                # Append the white space token to the document
+                texts.append(text[pos:start])
+                spaces.append(False)
 
-            # We are looking for a character that is the opposite of 'is_space'
-            # if 'is_space' is True, then we want to find a character that is
-            # not a space. and vice versa. This event marks the end of a token.
-            is_current_space = char.isspace()
+            # Process substring for prefix, infix, suffix and exception cases.
+            # A run of non white space characters is always followed by
+            # a white space, unless it reaches the end of the text.
+            doc = tokenize(match.group(), end < text_size, doc)
 
-            if is_current_space != is_space:
+            # Skip the white space already recorded as `space_after` of the token
+            pos = end + 1
 
-                # Create the TokenMeta object that can be later used to retrieve the token
-                # from the text
-                token_meta = TokenMeta(
-                    text=str(text[pos : (i - 1) + 1]), space_after=is_current_space
-                )
+        # The white spaces at the end of the text make up the last token
+        if pos < text_size:
 
-                # if is_space is True that means detected token is composed of only whitespaces
-                # so we dont need to check for prefix, infixes etc.
-                if is_space:
+            # Append the white space token to the document
+            texts.append(text[pos:])
+            spaces.append(False)
 
-                    # Append the token to the document
-                    doc.token_metas.append(token_meta)
-                else:
+        return doc
+
+    def pipe(
+        self, texts: Iterable[Union[SyString, str]], batch_size: int = 1000, n_process: int = 1
+    ) -> Iterator[TextDoc]:
+        """Tokenize a stream of texts.
 
-                    # Process substring for prefix, infix, suffix and exception cases
-                    span = str(text[pos:i])
+        The texts are read and tokenized batch by batch, so `texts` can be a
+        generator of any length, and only a few batches are held in memory at once.
 
-                    doc = self._tokenize(span, token_meta, doc)
+        Args:
+            texts: The texts to be tokenized.
+            batch_size: The number of texts read at once, and sent at once to a
+                worker process when `n_process` is greater than 1.
+            n_process: The number of processes used to tokenize the texts, or -1
+                to use as many processes as there are CPUs. The tokenizer is sent
+                once to each process, when it starts.
 
-                # Adjust the position 'pos' against which
-                # we compare the currently visited chararater
-                if is_current_space:
-                    pos = i + 1
-                else:
-                    pos = i
+        Returns:
+            An iterator over the TextDoc object of each text, in the order of `texts`.
 
-                # Update the character type of which we are searching
-                # the opposite (space vs. not space).
-                # prevent 'pos' from being out of bound
-                if pos < text_size:
-                    is_space = text[pos].isspace()
+        Raises:
+            ValueError: If `n_process` is neither -1 nor positive, or if `batch_size`
+                is not positive.
+        """
 
-            # Create the last token if the end of the string is reached
-            if i == text_size - 1 and pos <= i:
+        # The arguments are checked here rather than in the generator below, so
+        # that invalid ones are reported by the call itself
+        if n_process == -1:
+            n_process = os.cpu_count() or 1
 
-                # Create the TokenMeta object that can be later used to retrieve the token
-                # from the text
-                token_meta = TokenMeta(text=str(text[pos:]), space_after=is_current_space)
+        if n_process < 1:
+            raise ValueError(f"n_process must be -1 or a positive integer, got {n_process}")
 
-                # if is_space is True that means detected token is composed of only whitespaces
-                # so we dont need to check for prefix, infixes etc.
-                if is_space:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
 
-                    # Append the token to the document
-                    doc.token_metas.append(token_meta)
-                else:
+        return self._pipe(texts, batch_size, n_process)
 
-                    # Process substring for prefix, infix, suffix and exception cases
-                    span = str(text[pos:None])
-                    doc = self._tokenize(span, token_meta, doc)
+    def _pipe(
+        self, texts: Iterable[Union[SyString, str]], batch_size: int, n_process: int
+    ) -> Iterator[TextDoc]:
+        """Tokenize a stream of texts, once the arguments of `pipe` are checked.
 
-        return doc
+        Args:
+            texts: The texts to be tokenized.
+            batch_size: The positive number of texts read at once.
+            n_process: The positive number of processes used to tokenize the texts.
+
+        Yields:
+            doc: The TextDoc object of each text, in the order of `texts`.
+        """
+
+        # Syft strings are converted to `str` before being sent to the workers
+        batches = _batches(texts, batch_size)
+
+        if n_process == 1:
+
+            for batch in batches:
+                for text in batch:
+                    yield self(text)
+
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=n_process,
+            initializer=_init_worker,
+            initargs=(self,),
+        )
+
+        # The batches sent to the workers and not yet yielded, in order. Only a
+        # couple of batches per worker are sent ahead, so that the workers are
+        # kept busy without reading the whole of `texts`.
+        futures = deque()
+
+        try:
+
+            for batch in islice(batches, n_process * 2):
+                futures.append(executor.submit(_tokenize_batch_in_worker, batch))
+
+            while futures:
+
+                docs = futures.popleft().result()
+
+                # Send the next batch, if any, before yielding the documents so
+                # that the workers go on while the documents are consumed
+                for batch in islice(batches, 1):
+                    futures.append(executor.submit(_tokenize_batch_in_worker, batch))
+
+                yield from docs
+
+        finally:
+
+            # When the consumer stops early, the batches not yet started are
+            # dropped instead of being tokenized for nothing
+            for future in futures:
+                future.cancel()
+
+            executor.shutdown(wait=True)
+
+    def iter_tokenize(self, chunks: Iterable[Union[SyString, str]]) -> Iterator[Token]:
+        """Tokenize a text given as a stream of chunks, e.g. the lines of a large file,
+        without holding the whole text or all its tokens in memory.
+
+        The tokens are the same as those of the concatenation of the chunks. Each
+        yielded token belongs to a TextDoc holding only a piece of the text, so
+        `token.position` is relative to that piece.
+
+        Args:
+            chunks: The consecutive chunks of the text to be tokenized.
+
+        Yields:
+            token: The Token objects of the text, in order.
+        """
+
+        # The chunks making up the end of the text received so far, which is
+        # not tokenized yet. They are only joined when the text is cut, so that
+        # a long stretch of text without white spaces is not copied again and
+        # again as its chunks come in.
+        pending = []
 
-    def _tokenize(self, substring: str, token_meta: TokenMeta, doc: TextDoc) -> TextDoc:
+        for chunk in chunks:
+
+            chunk = str(chunk)
+
+            if not chunk:
+                continue
+
+            # The text is cut at the start of its last run of non white space
+            # characters, if that run follows a white space. Tokenizing both
+            # parts separately then gives the same tokens as tokenizing the whole
+            # text, since the white space before the cut is not needed to know
+            # how the following characters are tokenized.
+            #
+            # Only the new chunk is searched for that run. If the chunk has only
+            # white spaces, the last run is in the pending text, which was
+            # already cut before it.
+            head = chunk.rstrip()
+
+            if not head:
+                pending.append(chunk)
+                continue
+
+            # The position of the start of the last run within the chunk
+            last_run_start = len(head) - len(head.rsplit(maxsplit=1)[-1])
+
+            # The last run starts the chunk and continues the pending text, or
+            # starts the whole text, so the text can't be cut yet
+            if last_run_start == 0 and not (pending and pending[-1][-1].isspace()):
+                pending.append(chunk)
+                continue
+
+            pending.append(chunk[:last_run_start])
+
+            yield from self("".join(pending))
+
+            pending = [chunk[last_run_start:]]
+
+        # Tokenize what is left at the end of the text
+        if pending:
+            yield from self("".join(pending))
+
+    def _tokenize(self, substring: str, space_after: bool, doc: TextDoc) -> TextDoc:
         """Tokenize each substring formed after splitting affixes and processing
         exceptions.
 
         Args:
             substring: The substring to tokenize.
-            token_meta: The TokenMeta object of original substring
-                before splitting affixes and exceptions.
+            space_after: Whether the original substring, before splitting
+                affixes and exceptions, is followed by a white space or not.
             doc: Document object.
 
         Returns:
-            doc: Document with all the TokenMeta objects of every token after splitting
+            doc: Document with the meta data of every token after splitting
                 affixes and exceptions.
         """
 
-        # If there is trailing space after the substring in text.
-        space_after = token_meta.space_after
+        # A word made of letters only that is not an exception case is a
+        # token of its own, when the affix rules can't split it.
+        if (
+            self._letters_only_is_token
+            and substring.isalpha()
+            and substring not in self._exception_orths
+        ):
+            doc.token_texts.append(self._share_text(substring))
+            doc.token_spaces.append(space_after)
+
+            return doc
+
+        # Get the texts of the tokens formed as result of splitting the affixes
+        # and exception cases. Repeated substrings are served from the cache.
+        texts = self._cached_decompose(substring)
+
+        # Add the texts of these tokens to the TextDoc's `token_texts` column
+        doc.token_texts.extend(texts)
+
+        # Only the last token can be followed by a white space, according to
+        # the original substring.
+        doc.token_spaces.extend(bytes(len(texts) - 1))
+        doc.token_spaces.append(space_after)
+
+        return doc
+
+    def _decompose(self, substring: str) -> Tuple[str, ...]:
+        """Split a substring into the texts of its tokens after processing prefixes,
+        infixes, suffixes and exceptions.
+
+        The result only depends on the substring and on the tokenization rules.
+        This method is wrapped by an LRU cache (`_cached_decompose`) in `load_rules`.
+
+        Args:
+            substring: The substring to tokenize.
+
+        Returns:
+            The texts of the tokens, in the order in which they appear in the substring.
+        """
 
         # Get the remaining substring,affixes containing list of
-        # TokenMeta for each type affix and list of TokenMeta of
+        # token texts for each type affix and list of token texts of
         # exceptions after splitting the affixes.
         substring, affixes, exception_tokens = self._split_affixes(substring=substring)
 
-        # Add all the `TokenMeta` objects formed as result of splitting
-        # the affixes and exception cases to the TextDoc's `token_metas` list.
-        doc = self._attach_tokens(
-            doc=doc,
-            substring=substring,
-            space_after=space_after,
-            affixes=affixes,
-            exception_tokens=exception_tokens,
+        # Get the texts of all the tokens formed as result of splitting
+        # the affixes and exception cases, in the order of the text.
+        texts = self._attach_tokens(
+            substring=substring, affixes=affixes, exception_tokens=exception_tokens
         )
 
-        return doc
+        # Share the short token texts, as they are likely to occur again
+        return tuple([self._share_text(text) for text in texts])
+
+    def _share_text(self, text: str) -> str:
+        """Returns the string object shared by the occurrences of `text`, adding
+        `text` to the table of shared texts if it is short and the table is not full.
+
+        Args:
+            text: A token text.
+
+        Returns:
+            A string equal to `text`.
+        """
 
-    def _split_affixes(self, substring: str) -> Tuple[str, DefaultDict, List[TokenMeta]]:
+        shared_texts = self._shared_texts
+
+        shared = shared_texts.get(text)
+
+        if shared is not None:
+            return shared
+
+        if len(text) < _MAX_SHARED_SIZE and len(shared_texts) < _MAX_SHARED_TEXTS:
+            shared_texts[text] = text
+
+        return text
+
+    def _split_affixes(self, substring: str) -> Tuple[str, AffixBuckets, List[str]]:
         """Process substring for tokenizing prefixes, infixes, suffixes and exceptions.
 
         Args:
@@ -284,23 +645,25 @@ class SpacyTokenizer:
 
         Returns:
             substring: The substring to tokenize.
-            affixes: Dict holding TokenMeta lists of each affix
+            affixes: AffixBuckets holding the lists of token texts of each affix
                 types as a result of splitting affixes
-            exception_tokens: The list of exception tokens TokenMeta objects.
+            exception_tokens: The list of texts of the exception tokens.
         """
 
         infixes = []
         exception_tokens = []
 
-        next_affix = ["prefix", "suffix"]
+        # Holds the lists of token texts of each affix types(prefix, suffix, infix)
+        affixes = AffixBuckets()
 
-        # Dict holding TokenMeta lists of each affix types(prefix, suffix, infix)
-        affixes = defaultdict(list)
+        # Bind the attributes used in the loop to local names
+        exceptions = self._exception_orths
+        find_prefix = self.find_prefix
+        find_suffix = self.find_suffix
 
-        # The first element in the `next_affix` list is 'prefix'.
+        # Even values of `i` search for a prefix and odd values for a suffix.
         # since we should start by finding prefixes, we fix the
         # index i = 0.
-        # Start by finding prefixes.
         i = 0
 
         # Holds the last value of `i` at the moment when either a prefix or a suffix is matched.
@@ -314,231 +677,191 @@ class SpacyTokenizer:
         # neither a prefix nor a suffix is matched in the substring.
         while i - last_i <= 2:
 
-            if substring in self.exceptions:
-                # Get a list of exception  `TokenMeta` objects to be added to the TextDoc.
-                exception_tokens, substring = self._get_exception_token_metas(substring)
+            if substring in exceptions:
+                # Get the list of exception token texts to be added to the TextDoc.
+                exception_tokens, substring = self._get_exception_texts(substring)
 
                 break
 
-            # Get affix type (prefix or suffix)
-            affix_type = next_affix[i % 2]
+            # The affix regexes are searched only once per iteration, the length
+            # of the match is passed on to split the affix off the substring.
+            if i % 2 == 0:
+
+                pre_len = find_prefix(substring)
+
+                if pre_len:
+                    # Get the text of the prefix along with updated
+                    # substring after removing the prefix
+                    prefix, substring = self._get_prefix_text(substring, pre_len)
+
+                    affixes.prefix.append(prefix)
+
+                    last_i = i
+
+            else:
 
-            affix_finder = getattr(self, f"find_{affix_type}")
+                suff_len = find_suffix(substring)
 
-            if affix_finder(substring):
-                # Get the `TokenMeta` object of the affix along with updated
-                # substring after removing the affix
-                token_meta, substring = getattr(self, f"_get_{affix_type}_token_meta")(substring)
+                if suff_len:
+                    # Get the text of the suffix along with updated
+                    # substring after removing the suffix
+                    suffix, substring = self._get_suffix_text(substring, suff_len)
 
-                affixes[f"{affix_type}"].append(token_meta)
+                    affixes.suffix.append(suffix)
 
-                last_i = i
+                    last_i = i
 
             # Change the affix type.
             i += 1
 
-        # Get infix TokenMeta objects if any.
-        if self.infix_matches(substring):
-            infixes, substring = self._get_infix_token_metas(substring)
-            affixes["infix"].extend(infixes)
+        # Get the infix token texts if any. The infix matches are searched
+        # for only once and passed on to split the substring.
+        infix_matches = self.infix_matches(substring)
+
+        if infix_matches:
+            infixes, substring = self._get_infix_texts(substring, infix_matches)
+            affixes.infix.extend(infixes)
 
         return substring, affixes, exception_tokens
 
     def _attach_tokens(
-        self,
-        doc: TextDoc,
-        substring: str,
-        space_after: bool,
-        affixes: DefaultDict,
-        exception_tokens: List[TokenMeta],
-    ) -> TextDoc:
-        """Add all the `TokenMeta` objects which are the result of splitting affixes
-        to TextDoc's `token_metas` list. Returns TextDoc object.
+        self, substring: str, affixes: AffixBuckets, exception_tokens: List[str]
+    ) -> List[str]:
+        """Collect the texts of all the tokens which are the result of splitting affixes
+        and exceptions in the order in which they appear in the text.
 
         Args:
-            doc: Original Document
             substring: The substring remaining after splitting all the affixes.
-            space_after: If there is a space after the original substring before splitting any affixes
-                in the text.
-            affixes: Dict holding TokenMeta lists of each affix types(prefix, suffix, infix)
-                formed as the result of splitting affixes.
-            exception_tokens: The list of TokenMeta object of exception tokens.
+            affixes: AffixBuckets holding the lists of token texts of each affix
+                types(prefix, suffix, infix) formed as the result of splitting affixes.
+            exception_tokens: The list of texts of the exception tokens.
 
         Returns:
-            doc: Document with all the TokenMeta objects of every token after splitting
+            texts: The list of texts of every token after splitting
                 affixes and exceptions.
         """
 
-        # Append the prefix TokenMeta list in doc
-        doc.token_metas.extend(affixes["prefix"])
-
-        # Append the exceptions TokenMeta list in doc
-        doc.token_metas.extend(exception_tokens)
-
-        # If subtring is remaining after splitting all the affixes.
-        if substring:
-
-            # Create the TokenMeta object
-            token_meta = TokenMeta(
-                text=substring,
-                space_after=False,  # for the last token space_after will be updated explicitly according to the original substring.
-            )
+        # The substring remaining after splitting all the affixes, if any, is a token.
+        remaining = [substring] if substring else []
 
-            # Append the token to the document
-            doc.token_metas.append(token_meta)
-
-        # Append the infixes TokenMeta list in doc
-        doc.token_metas.extend(affixes["infix"])
-
-        # Append the suffixes TokenMeta list in doc
-        doc.token_metas.extend(reversed(affixes["suffix"]))
-
-        # Get the last token and update it's space_after attr according to original substring's TokenMeta data
-        doc.token_metas[-1].space_after = space_after
-
-        return doc
+        # Build the list in a single pass, in the order of the text: prefixes, exceptions,
+        # the remaining substring, infixes and finally the suffixes, which were found
+        # starting from the end of the substring.
+        return [
+            *affixes.prefix,
+            *exception_tokens,
+            *remaining,
+            *affixes.infix,
+            *affixes.suffix[::-1],
+        ]
 
-    def _get_prefix_token_meta(self, substring: str) -> Tuple[TokenMeta, str]:
-        """Makes TokenMeta data for substring which are prefixes.
+    def _get_prefix_text(self, substring: str, pre_len: int) -> Tuple[str, str]:
+        """Splits the prefix off the substring.
 
         Args:
             substring: The substring to tokenize.
+            pre_len: The length of the prefix, as returned by `find_prefix`.
+                It should be greater than 0.
 
         Returns:
-            token_meta: The TokenMeta object with TokenMeta data of prefix.
+            prefix: The text of the prefix token.
             substring: The updated substring after removing prefix.
         """
 
-        # Get the length of prefix match in the substring.
-        pre_len = self.find_prefix(substring)
-
-        # break if pattern matches the empty string
-        if pre_len == 0:
-            return None, substring
-
-        # Create the TokenMeta object
-        token_meta = TokenMeta(
-            text=str(substring[:pre_len]),
-            space_after=False,  # for the last token space_after will be updated explicitly according to the original substring.
-        )
+        # The text of the prefix token
+        prefix = substring[:pre_len]
 
         # Update the remaining substring after removing the prefix.
         substring = substring[pre_len:]
 
-        return token_meta, substring
+        return prefix, substring
 
-    def _get_suffix_token_meta(self, substring: str) -> Tuple[TokenMeta, str]:
-        """Makes TokenMeta data for substring suffixes.
+    def _get_suffix_text(self, substring: str, suff_len: int) -> Tuple[str, str]:
+        """Splits the suffix off the substring.
 
         Args:
             substring: The `substring` to tokenize.
+            suff_len: The length of the suffix, as returned by `find_suffix`.
+                It should be greater than 0.
 
         Returns:
-            token_meta: The TokenMeta object of the suffix.
+            suffix: The text of the suffix token.
             substring: The updated substring after removing the suffix.
         """
 
-        # Get the length of suffix match in the substring.
-        suff_len = self.find_suffix(substring)
+        # The position in the substring where the suffix starts
+        suffix_start = len(substring) - suff_len
 
-        # break if pattern matches the empty string
-        if suff_len == 0:
-            return None, substring
-
-        # Create the TokenMeta object
-        token_meta = TokenMeta(
-            text=str(substring[len(substring) - suff_len :]),
-            space_after=False,  # for the last token space_after will be updated explicitly in end.
-        )
+        # The text of the suffix token
+        suffix = substring[suffix_start:]
 
         # Update the remaining substring after removing the suffix.
-        substring = substring[:-suff_len]
+        substring = substring[:suffix_start]
 
-        return token_meta, substring
+        return suffix, substring
 
-    def _get_infix_token_metas(self, substring: str) -> Tuple[List[TokenMeta], str]:
-        """Makes list of TokenMeta data for substring which are infixes.
+    def _get_infix_texts(self, substring: str, infixes: List[Match]) -> Tuple[List[str], str]:
+        """Splits the substring into the infixes and the pieces between them.
 
         Args:
             substring: The substring to tokenize.
+            infixes: The infix matches in `substring`, as returned by `infix_matches`.
 
         Returns:
-            infix_tokens_metas: the list of TokenMeta objects of infixes
-                found in `substring`.
+            infix_texts: the list of texts of the infixes and of the pieces
+                between them found in `substring`.
             substring: The updated substring after processing for all infixes.
         """
 
-        # Get all the infix matches in list
-        infixes = self.infix_matches(substring)
-
-        # List to hold `TokenMeta` object of all infixes
-        infix_tokens_metas = []
+        # List to hold the texts of all infixes and the pieces between them
+        infix_texts = []
 
-        # List holding start and end position of tokens
-        # created due to infixes relative to substring, starting at 0
-        positions = [0]
+        # The start position, relative to substring, of the piece
+        # preceding the current infix
+        start_pos = 0
 
+        # Each infix splits the substring into the piece preceding it and
+        # the infix itself. `match.span()` gets both boundaries in one call.
+        # Empty pieces, e.g. when the substring starts with an infix or two
+        # infixes are adjacent, are skipped.
         for match in infixes:
-            positions.extend([match.start(), match.end()])
+            infix_start, infix_end = match.span()
 
-        # Adding the endpos of last token
-        positions.append(len(substring))
+            for end_pos in (infix_start, infix_end):
+                if start_pos != end_pos:
+                    # Append the token to the infix_list
+                    infix_texts.append(substring[start_pos:end_pos])
 
-        for i in range(len(positions) - 1):
-            # start and end postion of token relative to substring
-            start_pos = positions[i]
-            end_pos = positions[i + 1]
+                start_pos = end_pos
 
-            # Check if at the end of the substring
-            if start_pos == end_pos:
-                break
-
-            else:
-                # Create the TokenMeta object
-                token_meta = TokenMeta(
-                    text=str(substring[start_pos:end_pos]),
-                    space_after=False,  #  For this token space_after will be updated explicitly in end.
-                )
-
-                # Append the token to the infix_list
-                infix_tokens_metas.append(token_meta)
+        # Add the piece following the last infix, if any
+        if start_pos != len(substring):
+            infix_texts.append(substring[start_pos:])
 
         # There is no remaining substring
         substring = ""
 
-        return infix_tokens_metas, substring
+        return infix_texts, substring
 
-    def _get_exception_token_metas(self, substring: str) -> Tuple[List[TokenMeta], str]:
-        """Make a list of TokenMeta objects of exceptions found in `substring`.
+    def _get_exception_texts(self, substring: str) -> Tuple[List[str], str]:
+        """Make a list of the texts of the tokens an exception `substring` is split into.
 
         Args:
             substring: The substring to tokenize.
 
         Returns:
-            exception_token_metas : the list of exceptions TokenMeta
-                objects.
+            exception_texts : the list of exception token texts.
             substring: The updated substring after processing the exceptions.
 
         """
 
-        # List to hold TokenMeta objects of exceptions found in the `substring`.
-        exception_token_metas = []
-
-        for orth in self.exceptions[substring]:
-
-            # Create the TokenMeta object
-            token_meta = TokenMeta(
-                text=orth,
-                space_after=False,  # for the last token space_after will be updated explicitly in end.
-            )
-
-            # Append the token to the  exception tokens list
-            exception_token_metas.append(token_meta)
+        # List holding the texts of the exception tokens found in the `substring`.
+        exception_texts = list(self._exception_orths[substring])
 
         # There is no remaining substring.
         substring = ""
 
-        return exception_token_metas, substring
+        return exception_texts, substring
 
     def infix_matches(self, substring: str) -> List[Match]:
         """Find internal split points of the string, such as hyphens.
@@ -562,7 +885,7 @@ class SpacyTokenizer:
 
     def find_prefix(self, substring: str) -> int:
         """Find the length of a prefix that should be segmented from the
-        string, or None if no prefix rules match.
+        string, or 0 if no prefix rules match.
 
         Args:
             substring: The string to segment.
@@ -583,7 +906,7 @@ class SpacyTokenizer:
 
     def find_suffix(self, substring: str) -> int:
         """Find the length of a suffix that should be segmented from the
-        string, or None if no suffix rules match.
+        string, or 0 if no suffix rules match.
 
         Args:
             substring: The string to segment.
@@ -601,3 +924,44 @@ class SpacyTokenizer:
 
         # Return the length of the suffix match in the substring.
         return (match.end() - match.start()) if match is not None else 0
+
+
+# The tokenizer used by a worker process of `SpacyTokenizer.pipe`
+_worker_tokenizer = None
+
+
+def _init_worker(tokenizer: SpacyTokenizer):
+    """Sets the tokenizer of a worker process of `SpacyTokenizer.pipe`."""
+
+    global _worker_tokenizer
+
+    _worker_tokenizer = tokenizer
+
+
+def _tokenize_batch_in_worker(texts: List[str]) -> List[TextDoc]:
+    """Tokenizes a batch of texts in a worker process of `SpacyTokenizer.pipe`."""
+
+    return [_worker_tokenizer(text) for text in texts]
+
+
+def _batches(texts: Iterable[Union[SyString, str]], batch_size: int) -> Iterator[List[str]]:
+    """Splits a stream of texts into lists of `batch_size` texts, the last one
+    possibly being shorter. The texts are read only as the batches are consumed.
+
+    Args:
+        texts: The texts to be split.
+        batch_size: The number of texts in each batch.
+
+    Yields:
+        batch: The next texts of the stream, converted to `str`.
+    """
+
+    texts = map(str, texts)
+
+    batch = list(islice(texts, batch_size))
+
+    while batch:
+
+        yield batch
+
+        batch = list(islice(texts, batch_size))
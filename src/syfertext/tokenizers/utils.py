@@ -1,10 +1,79 @@
 # stdlib
 import re
+from functools import lru_cache
+from itertools import groupby
 from typing import Pattern
 from typing import Match
 from typing import Tuple
 from typing import Union
 from typing import Dict
+from typing import Callable
+from typing import List
+from typing import Iterable
+
+# The maximum number of compiled regex objects kept by `compile_cached_regex`.
+# Tokenizers using the same rules (e.g. the default punctuation rules) share the
+# same compiled regex objects, while the least recently used ones are dropped
+# when many distinct rule sets are compiled, e.g. one per user.
+_REGEX_CACHE_SIZE = 64
+
+
+# The characters that have a special meaning in a regex when not escaped
+_REGEX_SPECIAL_CHARS = set(".^$*+?{}[]\\|()")
+
+
+def _is_single_char(piece: str) -> bool:
+    """Checks whether a regex piece matches exactly one literal character.
+
+    Args:
+        piece: The regex piece, e.g. "a", "\\!" or "[0-9]".
+
+    Returns:
+        True if `piece` is a single non-special character, or a single escaped
+        non-alphanumeric character. False otherwise.
+    """
+
+    if len(piece) == 1:
+        return piece not in _REGEX_SPECIAL_CHARS
+
+    # Escaped alphanumeric characters, e.g. "\\d", are character classes or
+    # anchors, not literal characters
+    return len(piece) == 2 and piece[0] == "\\" and not piece[1].isalnum()
+
+
+def _fold_single_chars(pieces: Iterable[str]) -> List[str]:
+    """Folds each run of consecutive regex pieces that match a single literal
+    character into a character class, e.g. ["a", "\\!", "bc", "d"] gives
+    ["[a\\!]", "bc", "d"]. The regex engine tests a character class in one step,
+    while it tries the alternatives of an alternation one after the other.
+
+    Only consecutive pieces are folded, so the alternation keeps its order and
+    the regex built from the folded pieces matches exactly as the original one.
+
+    Args:
+        pieces: The regex pieces, in the order of the alternation.
+
+    Returns:
+        The folded regex pieces.
+    """
+
+    folded = []
+
+    # Group the consecutive pieces according to whether they match a single
+    # literal character or not
+    for is_single_char, run in groupby(pieces, key=_is_single_char):
+
+        run = list(run)
+
+        # Fold the runs of more than one character. Unescaped characters are
+        # escaped since some of them, e.g. "-", are special within a character
+        # class.
+        if is_single_char and len(run) > 1:
+            folded.append("[" + "".join([re.escape(c) if len(c) == 1 else c for c in run]) + "]")
+        else:
+            folded.extend(run)
+
+    return folded
 
 
 # The following three functions for compiling prefix, suffix and infix regex are adapted
@@ -19,11 +88,14 @@ def compile_prefix_regex(entries: Tuple) -> Pattern:
 
     if "(" in entries:
         # Handle deprecated data
-        expression = "|".join(["^" + re.escape(piece) for piece in entries if piece.strip()])
-        return re.compile(expression)
+        pieces = _fold_single_chars(re.escape(piece) for piece in entries if piece.strip())
     else:
-        expression = "|".join(["^" + piece for piece in entries if piece.strip()])
-        return re.compile(expression)
+        pieces = _fold_single_chars(piece for piece in entries if piece.strip())
+
+    # Anchor the whole alternation once rather than each of its branches
+    expression = "^(?:" + "|".join(pieces) + ")"
+
+    return re.compile(expression)
 
 
 def compile_suffix_regex(entries: Tuple) -> Pattern:
@@ -34,7 +106,10 @@ def compile_suffix_regex(entries: Tuple) -> Pattern:
         The regex object. to be used for Tokenizer.suffix_search.
     """
 
-    expression = "|".join([piece + "$" for piece in entries if piece.strip()])
+    pieces = _fold_single_chars(piece for piece in entries if piece.strip())
+
+    # Anchor the whole alternation once rather than each of its branches
+    expression = "(?:" + "|".join(pieces) + ")$"
 
     return re.compile(expression)
 
@@ -47,6 +122,33 @@ def compile_infix_regex(entries: Tuple) -> Pattern:
         The regex object. to be used for Tokenizer.infix_finditer.
     """
 
-    expression = "|".join([piece for piece in entries if piece.strip()])
+    pieces = _fold_single_chars(piece for piece in entries if piece.strip())
+    expression = "|".join(pieces)
 
     return re.compile(expression)
+
+
+def compile_cached_regex(compile_func: Callable[[Tuple], Pattern], entries: Tuple) -> Pattern:
+    """Compile a sequence of rules using `compile_func`, reusing the regex object
+    already compiled for the same function and rules if any.
+
+    Args:
+        compile_func: One of `compile_prefix_regex`, `compile_suffix_regex`
+            or `compile_infix_regex`.
+        entries (tuple): The rules to compile.
+
+    Returns:
+        The regex object.
+    """
+
+    # The rules are turned into a tuple so that lists can be used as keys too
+    return _compile_regex(compile_func, tuple(entries))
+
+
+@lru_cache(maxsize=_REGEX_CACHE_SIZE)
+def _compile_regex(compile_func: Callable[[Tuple], Pattern], entries: Tuple) -> Pattern:
+    """Compile `entries` using `compile_func`. This function is wrapped by an LRU cache
+    keyed by the compiling function and the rules.
+    """
+
+    return compile_func(entries)
@@ -1,3 +1,7 @@
+from typing import List
+from typing import Sequence
+
+
 class Vocab:
     """A class that represents a vocabulary
     """
@@ -20,7 +24,35 @@ class Vocab:
 
     def get_id(self, text):
 
-        if text not in self.text2id:
+        # Known words, which are most of the tokens of a text,
+        # only cost a single dict lookup
+        token_id = self.text2id.get(text)
+
+        if token_id is None:
             self.add(text)
+            token_id = self.text2id[text]
+
+        return token_id
+
+    def get_ids(self, texts: Sequence[str]) -> List[int]:
+        """Gets the IDs of several words at once, adding the unknown ones
+        to the vocab.
+
+        Args:
+            texts: The words to get the IDs of.
+
+        Returns:
+            The ID of each word in `texts`, in the same order.
+        """
+
+        # Look all the words up in a single pass
+        get = self.text2id.get
+        token_ids = [get(text) for text in texts]
+
+        # Add the unknown words, if any, in the order in which they appear
+        if None in token_ids:
+            for idx, token_id in enumerate(token_ids):
+                if token_id is None:
+                    token_ids[idx] = self.get_id(texts[idx])
 
-        return self.text2id[text]
+        return token_ids
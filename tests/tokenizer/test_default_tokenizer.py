@@ -0,0 +1,13 @@
+import pytest
+import syfertext.tokenizers as tokenizers
+
+
+@pytest.mark.parametrize("text", ["", " ", "I love apples", "  I  love apples ", "one"])
+def test_default_tokenizer_splits_on_single_spaces(text):
+    tokenizer = tokenizers.DefaultTokenizer(prefixes=[], suffixes=[], infixes=[], exceptions={})
+    assert tokenizer(text) == text.split(" ")
+
+
+def test_default_tokenizer_splits_on_other_white_spaces():
+    tokenizer = tokenizers.DefaultTokenizer(prefixes=[], suffixes=[], infixes=[], exceptions={})
+    assert tokenizer("I\tlove\napples\r\n") == ["I", "love", "apples", "", ""]
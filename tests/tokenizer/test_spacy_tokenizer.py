@@ -1,6 +1,13 @@
 import pytest
-import syfertext.tokenizers as tokenizer
+import syfertext.tokenizers as tokenizers
 import os
+import pickle
+import itertools
+import json
+import time
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from syfertext.data.units import TextDoc
 
 
 def test_tokenizer_handles_no_word(tokenizer_spacy):
@@ -89,3 +96,238 @@ def test_tokenizer_suspected_freeing_strings(tokenizer_spacy):
     tokens2 = tokenizer_spacy(text2)
     assert tokens1[0].text == "Lorem"
     assert tokens2[0].text == "Lorem"
+
+
+@pytest.mark.parametrize(
+    "text", ["I love apples", "I  love apples ", " I love ", "  a  b   c ", " ", "  "]
+)
+def test_tokenizer_reconstructs_text(tokenizer_spacy, text):
+    doc = tokenizer_spacy(text)
+    assert doc.text == text
+
+
+def test_tokenizer_load_rules_resets_cache():
+    tokenizer = tokenizers.SpacyTokenizer()
+    assert len(tokenizer("Hell-o")) == 3
+    tokenizer.load_rules(infixes=[])
+    assert len(tokenizer("Hell-o")) == 1
+
+
+@pytest.mark.parametrize("n_process", [1, 2])
+def test_tokenizer_pipe(tokenizer_spacy, n_process):
+    texts = ["Lorem, ipsum.", "", "NASDAQ:GOOG", "I love-apples"]
+    docs = list(tokenizer_spacy.pipe(texts, batch_size=2, n_process=n_process))
+    assert len(docs) == len(texts)
+    for doc, text in zip(docs, texts):
+        assert [token.text for token in doc] == [token.text for token in tokenizer_spacy(text)]
+
+
+@pytest.mark.parametrize("n_process", [1, 2])
+def test_tokenizer_pipe_stops_early_on_endless_input(tokenizer_spacy, n_process):
+    texts = (f"text number {i}" for i in itertools.count())
+    docs = tokenizer_spacy.pipe(texts, batch_size=3, n_process=n_process)
+    first_docs = list(itertools.islice(docs, 5))
+    docs.close()
+    assert [doc[2].text for doc in first_docs] == ["0", "1", "2", "3", "4"]
+
+
+@pytest.mark.parametrize("n_process,batch_size", [(0, 10), (-2, 10), (2, 0)])
+def test_tokenizer_pipe_rejects_invalid_arguments(tokenizer_spacy, n_process, batch_size):
+    with pytest.raises(ValueError):
+        tokenizer_spacy.pipe(["I love apples"], batch_size=batch_size, n_process=n_process)
+
+
+def test_tokenizer_pipe_uses_all_cpus(tokenizer_spacy, monkeypatch):
+    resolved = []
+    monkeypatch.setattr(tokenizers.spacy_tokenizer.os, "cpu_count", lambda: 3)
+    monkeypatch.setattr(
+        tokenizer_spacy, "_pipe", lambda texts, batch_size, n_process: resolved.append(n_process)
+    )
+    tokenizer_spacy.pipe(["I love apples"], n_process=-1)
+    assert resolved == [3]
+
+
+def test_tokenizer_pickle():
+    tokenizer = tokenizers.SpacyTokenizer(infixes=[])
+    tokenizer = pickle.loads(pickle.dumps(tokenizer))
+    assert tokenizer.infixes == []
+    assert [token.text for token in tokenizer("Hell-o, world")] == ["Hell-o", ",", "world"]
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [("don't", ["do", "n't"]), ("e.g.", ["e.g."]), ("(I'ma)", ["(", "I", "'m", "a", ")"])],
+)
+def test_tokenizer_handles_exceptions(tokenizer_spacy, text, expected):
+    tokens = tokenizer_spacy(text)
+    assert [token.text for token in tokens] == expected
+
+
+def test_tokenizer_handles_string_exceptions():
+    tokenizer = tokenizers.SpacyTokenizer(exceptions={"I'ma": ["I", "'m", "a"]})
+    assert [token.text for token in tokenizer("I'ma")] == ["I", "'m", "a"]
+
+
+def test_tokenizer_shares_compiled_regexes(tokenizer_spacy):
+    tokenizer = tokenizers.SpacyTokenizer(prefixes=list(tokenizer_spacy.prefixes))
+    assert tokenizer.prefix_search.__self__ is tokenizer_spacy.prefix_search.__self__
+    assert tokenizer.infix_finditer.__self__ is tokenizer_spacy.infix_finditer.__self__
+
+
+def test_tokenizer_regex_cache_is_bounded():
+    compile_regex = tokenizers.utils._compile_regex
+    compile_regex(tokenizers.utils.compile_prefix_regex, ("x0",))
+    misses = compile_regex.cache_info().misses
+    compile_regex(tokenizers.utils.compile_prefix_regex, ("x0",))
+    assert compile_regex.cache_info().misses == misses
+    for i in range(1, tokenizers.utils._REGEX_CACHE_SIZE + 1):
+        compile_regex(tokenizers.utils.compile_prefix_regex, (f"x{i}",))
+    misses = compile_regex.cache_info().misses
+    compile_regex(tokenizers.utils.compile_prefix_regex, ("x0",))
+    assert compile_regex.cache_info().misses == misses + 1
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [("-ab", ["-", "ab"]), ("a--b", ["a", "-", "-", "b"]), ("a-b-", ["a", "-", "b", "-"])],
+)
+def test_tokenizer_handles_edge_infixes(text, expected):
+    tokenizer = tokenizers.SpacyTokenizer(prefixes=[], suffixes=[], infixes=["-"])
+    assert [token.text for token in tokenizer(text)] == expected
+
+
+def test_tokenizer_doc_span(tokenizer_spacy):
+    doc = tokenizer_spacy("I love green apples")
+    doc[2].attributes["color"] = ["green"]
+    span = doc[1:3]
+    assert [token.text for token in span] == ["love", "green"]
+    assert span[-1].attributes == {"color": ["green"]}
+    span_doc = span.as_doc()
+    assert [token.text for token in span_doc] == ["love", "green"]
+    assert span_doc[1].attributes == {"color": ["green"]}
+    assert span.texts == ["love", "green"]
+    assert doc.texts == ["I", "love", "green", "apples"]
+    assert doc[0].attributes == {}
+
+
+def test_tokenizer_doc_token_metas(tokenizer_spacy):
+    doc = tokenizer_spacy("I love apples")
+    assert [token_meta.text for token_meta in doc.token_metas] == ["I", "love", "apples"]
+    assert [token_meta.space_after for token_meta in doc.token_metas] == [True, True, False]
+    assert doc[1].attributes == {}
+    assert doc.token_attributes == {}
+    doc[1].attributes["fruit"] = ["no"]
+    assert doc.token_metas[1].attributes == {"fruit": ["no"]}
+    doc[2].attributes.setdefault("fruit", []).append("yes")
+    assert doc[2].attributes == {"fruit": ["yes"]}
+    assert sorted(doc.token_attributes) == [1, 2]
+
+
+def test_token_attributes_is_dict(tokenizer_spacy):
+    doc = tokenizer_spacy("I love apples")
+    for token in doc:
+        assert isinstance(token.attributes, dict)
+        assert json.dumps(token.attributes) == "{}"
+    doc[0].attributes["pronoun"] = ["yes"]
+    assert json.dumps(doc[0].attributes) == '{"pronoun": ["yes"]}'
+    assert type(pickle.loads(pickle.dumps(doc[0].attributes))) is dict
+
+
+def test_doc_append_token():
+    doc = TextDoc()
+    doc.append_token("I", True)
+    doc.append_token("love", True)
+    doc.append_token("apples", False)
+    assert doc.text == "I love apples"
+    with pytest.raises(AttributeError):
+        doc.token_metas.append(doc.token_metas[0])
+
+
+def test_tokenizer_repeated_text_gives_new_doc():
+    tokenizer = tokenizers.SpacyTokenizer(cache_size=2)
+    doc = tokenizer("Hello, world!")
+    doc[0].attributes["seen"] = ["yes"]
+    other_doc = tokenizer("Hello, world!")
+    assert other_doc is not doc
+    assert [token.text for token in other_doc] == [token.text for token in doc]
+    assert other_doc[0].attributes == {}
+
+
+def test_tokenizer_cache_is_opt_in_and_bounded():
+    tokenizer = tokenizers.SpacyTokenizer()
+    tokenizer("a b")
+    assert len(tokenizer._doc_cache) == 0
+    tokenizer = tokenizers.SpacyTokenizer(cache_size=2)
+    for text in ["a b", "c d", "a b", "e f"]:
+        assert [token.text for token in tokenizer(text)] == text.split()
+    assert list(tokenizer._doc_cache) == ["a b", "e f"]
+    tokenizer = pickle.loads(pickle.dumps(tokenizer))
+    assert tokenizer.cache_size == 2
+
+
+def test_tokenizer_cache_is_thread_safe():
+    class SlowOrderedDict(collections.OrderedDict):
+        def get(self, key, default=None):
+            value = super().get(key, default)
+            # Let the other threads run between the lookup and what follows it
+            time.sleep(0.0001)
+            return value
+
+    tokenizer = tokenizers.SpacyTokenizer(cache_size=2)
+    tokenizer._doc_cache = SlowOrderedDict()
+    texts = [f"a b {i}" for i in range(4)]
+
+    def tokenize_texts(_):
+        for _ in range(50):
+            for text in texts:
+                assert [token.text for token in tokenizer(text)] == text.split()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(tokenize_texts, range(8)))
+    assert len(tokenizer._doc_cache) == 2
+
+
+def test_tokenizer_single_char_prefixes():
+    tokenizer = tokenizers.SpacyTokenizer(prefixes=["a", "-", "z", "\\$"])
+    assert [token.text for token in tokenizer("$-ab")] == ["$", "-", "a", "b"]
+    assert [token.text for token in tokenizer("b-")] == ["b-"]
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        ["Hello, wor", "ld!  How", " are", " you?"],
+        ["  ", "Hi", " ", " there ", ""],
+        ["ab", "cd", "ef gh", "ij", "\t", "kl"],
+        ["QUJD" * 256] * 100,
+        [],
+    ],
+)
+def test_tokenizer_iter_tokenize(tokenizer_spacy, chunks):
+    tokens = [(token.text, token.space_after) for token in tokenizer_spacy.iter_tokenize(chunks)]
+    doc = tokenizer_spacy("".join(chunks))
+    assert tokens == [(token.text, token.space_after) for token in doc]
+
+
+def test_tokenizer_splits_letters_only_words():
+    # Alphabetic exception cases are still split with the default rules
+    tokenizer = tokenizers.SpacyTokenizer()
+    assert [token.text for token in tokenizer("cannot go")] == ["can", "not", "go"]
+
+    # Custom affix rules may split words made of letters only
+    tokenizer = tokenizers.SpacyTokenizer(suffixes=["s"])
+    assert [token.text for token in tokenizer("cats")] == ["cat", "s"]
+
+
+def test_tokenizer_shares_token_texts(tokenizer_spacy):
+    doc = tokenizer_spacy("the cat, the hat, the end")
+    texts = [token.text for token in doc]
+    assert texts[0] is texts[3] is texts[6]
+    assert texts[2] is texts[5]
+
+
+def test_tokenizer_shared_texts_are_bounded(monkeypatch):
+    monkeypatch.setattr(tokenizers.spacy_tokenizer, "_MAX_SHARED_TEXTS", 3)
+    tokenizer = tokenizers.SpacyTokenizer()
+    tokenizer("one two three four five, " + "x" * 40)
+    assert list(tokenizer._shared_texts) == ["one", "two", "three"]